@@ -35,19 +35,18 @@ data coming from Bluetooth devices.
 
 # IMPORT
 
-from abc import ABCMeta
+from abc import ABC
 from abc import abstractmethod
 
 
 # INTERFACES
 
-class BLEAdvertisingDataParser(object):
+class BLEAdvertisingDataParser(ABC):
     """Interface to parse the advertising data sent by a Bluetooth device."""
-    __metaclass__ = ABCMeta
 
     @classmethod
     @abstractmethod
-    def parse(self, advertising_data):
+    def parse(cls, advertising_data):
         """Parse the BLE advertising_data.
 
         Args:
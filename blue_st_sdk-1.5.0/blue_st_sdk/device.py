@@ -594,6 +594,10 @@ class Device(Peripheral, object):
         if not features:
             return False
 
+        # Wrapping the data once, so that the features' parsers read it
+        # through zero-copy views instead of materializing byte slices.
+        data = memoryview(data)
+
         # Computing the timestamp.
         timestamp = self._unwrap_timestamp.unwrap(
             LittleEndian.bytes_to_uint16(data))
@@ -514,6 +514,8 @@ class ExtractedData(object):
     extracting data with the :meth:`blue_st_sdk.feature.Feature._extract_data()`
     method."""
 
+    __slots__ = ('_sample', '_read_bytes')
+
     def __init__(self, sample, read_bytes):
         """Constructor.
 
@@ -549,6 +551,8 @@ class ExtractedData(object):
 class Sample(object):
     """Class that contains the last data from the device."""
 
+    __slots__ = ('_data', '_description', '_timestamp', '_notification_time')
+
     def __init__(self, data, description, timestamp = 0):
         """Constructor.
 
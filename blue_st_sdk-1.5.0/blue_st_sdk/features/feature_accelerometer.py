@@ -28,16 +28,25 @@
 
 # IMPORT
 
+import struct
+
 from blue_st_sdk.feature import Feature
 from blue_st_sdk.feature import Sample
 from blue_st_sdk.feature import ExtractedData
 from blue_st_sdk.features.field import Field
 from blue_st_sdk.features.field import FieldType
-from blue_st_sdk.utils.number_conversion import LittleEndian
-from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidOperationException
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_ACC_STRUCT = struct.Struct('<3h')
+"""Precompiled decoder for the three little-endian int16 axis values."""
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureAccelerometer(Feature):
@@ -51,7 +60,9 @@ class FeatureAccelerometer(Feature):
     FEATURE_DATA_NAME = ["X", "Y", "Z"]
     FEATURE_DATA_MAX = +2000
     FEATURE_DATA_MIN = -2000
-    DATA_LENGTH_BYTES = 6
+    DATA_LENGTH_BYTES = _ACC_STRUCT.size
+    _NO_DATA_MSG = 'There are no %d bytes available to read.' \
+        % (DATA_LENGTH_BYTES)
     X_INDEX = 0
     Y_INDEX = 1
     Z_INDEX = 2
@@ -73,6 +84,7 @@ class FeatureAccelerometer(Feature):
         FieldType.Int16,
         FEATURE_DATA_MAX,
         FEATURE_DATA_MIN)
+    _FIELDS = (FEATURE_X_FIELD, FEATURE_Y_FIELD, FEATURE_Z_FIELD)
 
     def __init__(self, device):
         """Constructor.
@@ -84,14 +96,15 @@ class FeatureAccelerometer(Feature):
         super(FeatureAccelerometer, self).__init__(
             self.FEATURE_NAME,
             device,
-            [self.FEATURE_X_FIELD, self.FEATURE_Y_FIELD, self.FEATURE_Z_FIELD])
+            self._FIELDS)
 
     def _extract_data(self, timestamp, data, offset):
         """Extract the data from the feature's raw data.
         
         Args:
             timestamp (int): Data's timestamp.
-            data (str): The data read from the feature.
+            data (bytes, bytearray, or memoryview): The data read from the
+                feature.
             offset (int): Offset where to start reading data.
         
         Returns:
@@ -102,68 +115,124 @@ class FeatureAccelerometer(Feature):
             :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
                 if the data array has not enough data to read.
         """
-        if len(data) - offset < self.DATA_LENGTH_BYTES:
-            raise BlueSTInvalidDataException(
-                'There are no %s bytes available to read.' \
-                % (self.DATA_LENGTH_BYTES))
+        try:
+            values = _ACC_STRUCT.unpack_from(data, offset)
+        except struct.error:
+            raise BlueSTInvalidDataException(self._NO_DATA_MSG)
         sample = Sample(
-            [LittleEndian.bytes_to_int16(data, offset),
-             LittleEndian.bytes_to_int16(data, offset + 2),
-             LittleEndian.bytes_to_int16(data, offset + 4)],
-            self.get_fields_description(),
+            list(values),
+            self._description,
             timestamp)
         return ExtractedData(sample, self.DATA_LENGTH_BYTES)
 
     @classmethod
-    def get_accelerometer_x(self, sample):
+    def from_buffer_batch(cls, data, timestamps):
+        """Decode a buffer of consecutive accelerometer samples in one pass.
+
+        Useful when notifications are accumulated (e.g. FIFO dumps): the
+        whole buffer is decoded through a single C-level loop instead of one
+        Python-level call per sample.
+
+        Args:
+            data (bytes): Buffer containing a whole number of samples.
+            timestamps (list): Timestamps, one per sample in the buffer.
+
+        Returns:
+            list: A list of :class:`blue_st_sdk.feature.Sample` objects, one
+            per sample in the buffer.
+
+        Raises:
+            :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
+                if the data array does not contain a whole number of samples,
+                or if the number of timestamps does not match the number of
+                samples.
+        """
+        if len(data) % cls.DATA_LENGTH_BYTES:
+            raise BlueSTInvalidDataException(
+                'The data array does not contain a whole number of '
+                '%d bytes long samples.' % (cls.DATA_LENGTH_BYTES))
+        if len(timestamps) != len(data) // cls.DATA_LENGTH_BYTES:
+            raise BlueSTInvalidDataException(
+                'The number of timestamps does not match the number of '
+                'samples within the data array.')
+        return [Sample(list(values), cls._FIELDS, timestamp)
+                for values, timestamp
+                in zip(_ACC_STRUCT.iter_unpack(data), timestamps)]
+
+    @classmethod
+    def extract_xyz_floats(cls, data, offset=0):
+        """Decode one sample directly into the three axis values as floats.
+
+        Shortcut for streaming consumers (e.g. inference front-ends) that
+        only need the numeric values: the bytes are turned into floats in
+        one pass, without building the intermediate Sample object and
+        without going through the per-axis getters.
+
+        Args:
+            data (bytes, bytearray, or memoryview): The data read from the
+                feature.
+            offset (int): Offset where to start reading data.
+
+        Returns:
+            list: The accelerometer values on the three axis as floats.
+
+        Raises:
+            :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
+                if the data array has not enough data to read.
+        """
+        try:
+            x, y, z = _ACC_STRUCT.unpack_from(data, offset)
+        except struct.error:
+            raise BlueSTInvalidDataException(cls._NO_DATA_MSG)
+        return [float(x), float(y), float(z)]
+
+    @staticmethod
+    def get_accelerometer_x(sample):
         """Get the accererometer value on the X axis from a sample.
 
         Args:
             sample (:class:`blue_st_sdk.feature.Sample`): Sample data.
-        
+
         Returns:
             float: The accelerometer value on the X axis if the data array is
             valid, <nan> otherwise.
         """
-        if sample:
-            if sample._data:
-                if sample._data[self.X_INDEX]:
-                    return float(sample._data[self.X_INDEX])
-        return float('nan')
+        try:
+            return float(sample._data[0])
+        except (AttributeError, IndexError, TypeError):
+            return _NAN
 
-    @classmethod
-    def get_accelerometer_y(self, sample):
+    @staticmethod
+    def get_accelerometer_y(sample):
         """Get the accererometer value on the Y axis from a sample.
 
         Args:
             sample (:class:`blue_st_sdk.feature.Sample`): Sample data.
-        
+
         Returns:
             float: The accelerometer value on the Y axis if the data array is
             valid, <nan> otherwise.
         """
-        if sample:
-            if sample._data:
-                if sample._data[self.Y_INDEX]:
-                    return float(sample._data[self.Y_INDEX])
-        return float('nan')
+        try:
+            return float(sample._data[1])
+        except (AttributeError, IndexError, TypeError):
+            return _NAN
 
-    @classmethod
-    def get_accelerometer_z(self, sample):
+    @staticmethod
+    def get_accelerometer_z(sample):
         """Get the accererometer value on the Z axis from a sample.
 
         Args:
             sample (:class:`blue_st_sdk.feature.Sample`): Sample data.
-        
+
         Returns:
             float: The accelerometer value on the Z axis if the data array is
             valid, <nan> otherwise.
         """
-        if sample:
-            if sample._data:
-                if sample._data[self.Z_INDEX]:
-                    return float(sample._data[self.Z_INDEX])
-        return float('nan')
+        try:
+            return float(sample._data[2])
+        except (AttributeError, IndexError, TypeError):
+            return _NAN
 
     def read_accelerometer(self):
         """Read the accelerometer values.
@@ -179,10 +248,9 @@ class FeatureAccelerometer(Feature):
             :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
                 if the data array has not enough data to read.
         """
-        try:
-            self._read_data()
-            return [FeatureAccelerometer.get_accelerometer_x(self._get_sample()),
-                FeatureAccelerometer.get_accelerometer_y(self._get_sample()),
-                FeatureAccelerometer.get_accelerometer_z(self._get_sample())]
-        except (BlueSTInvalidOperationException, BlueSTInvalidDataException) as e:
-            raise e
+        self._read_data()
+        sample = self._get_sample()
+        if sample is None or not sample._data:
+            return [_NAN, _NAN, _NAN]
+        data = sample._data
+        return [float(data[0]), float(data[1]), float(data[2])]
@@ -38,6 +38,12 @@ from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidOperationException
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureGyroscope(Feature):
@@ -130,7 +136,7 @@ class FeatureGyroscope(Feature):
             if sample._data:
                 if sample._data[self.X_INDEX]:
                     return float(sample._data[self.X_INDEX])
-        return float('nan')
+        return _NAN
 
     @classmethod
     def get_gyroscope_y(self, sample):
@@ -147,7 +153,7 @@ class FeatureGyroscope(Feature):
             if sample._data:
                 if sample._data[self.Y_INDEX]:
                     return float(sample._data[self.Y_INDEX])
-        return float('nan')
+        return _NAN
 
     @classmethod
     def get_gyroscope_z(self, sample):
@@ -164,7 +170,7 @@ class FeatureGyroscope(Feature):
             if sample._data:
                 if sample._data[self.Z_INDEX]:
                     return float(sample._data[self.Z_INDEX])
-        return float('nan')
+        return _NAN
 
     def read_gyroscope(self):
         """Read the gyroscope values.
@@ -28,16 +28,28 @@
 
 # IMPORT
 
+import struct
+
 from blue_st_sdk.feature import Feature
 from blue_st_sdk.feature import Sample
 from blue_st_sdk.feature import ExtractedData
 from blue_st_sdk.features.field import Field
 from blue_st_sdk.features.field import FieldType
-from blue_st_sdk.utils.number_conversion import LittleEndian
-from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidOperationException
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_H_STRUCT = struct.Struct('<h')
+"""Precompiled decoder for the little-endian int16 humidity value."""
+
+_H_INV_SCALE = 0.1
+"""Reciprocal of the scale factor applied to the raw humidity value."""
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureHumidity(Feature):
@@ -51,7 +63,9 @@ class FeatureHumidity(Feature):
     FEATURE_DATA_NAME = "Humidity"
     FEATURE_DATA_MAX = 100
     FEATURE_DATA_MIN = 0
-    DATA_LENGTH_BYTES = 2
+    DATA_LENGTH_BYTES = _H_STRUCT.size
+    _NO_DATA_MSG = 'There are no %d bytes available to read.' \
+        % (DATA_LENGTH_BYTES)
     SCALE_FACTOR = 10.0
     FEATURE_FIELDS = Field(
         FEATURE_DATA_NAME,
@@ -59,6 +73,7 @@ class FeatureHumidity(Feature):
         FieldType.Float,
         FEATURE_DATA_MAX,
         FEATURE_DATA_MIN)
+    _FIELDS = (FEATURE_FIELDS,)
 
     def __init__(self, device):
         """Constructor.
@@ -70,14 +85,15 @@ class FeatureHumidity(Feature):
         super(FeatureHumidity, self).__init__(
             self.FEATURE_NAME,
             device,
-            [self.FEATURE_FIELDS])
+            self._FIELDS)
 
     def _extract_data(self, timestamp, data, offset):
         """Extract the data from the feature's raw data.
         
         Args:
             timestamp (int): Data's timestamp.
-            data (str): The data read from the feature.
+            data (bytes, bytearray, or memoryview): The data read from the
+                feature.
             offset (int): Offset where to start reading data.
         
         Returns:
@@ -88,32 +104,31 @@ class FeatureHumidity(Feature):
             :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
                 if the data array has not enough data to read.
         """
-        if len(data) - offset < self.DATA_LENGTH_BYTES:
-            raise BlueSTInvalidDataException(
-                'There are no %d bytes available to read.' \
-                % (self.DATA_LENGTH_BYTES))
+        try:
+            value = _H_STRUCT.unpack_from(data, offset)[0]
+        except struct.error:
+            raise BlueSTInvalidDataException(self._NO_DATA_MSG)
         sample = Sample(
-            [LittleEndian.bytes_to_int16(data, offset) / self.SCALE_FACTOR],
-            self.get_fields_description(),
+            [value * _H_INV_SCALE],
+            self._description,
             timestamp)
         return ExtractedData(sample, self.DATA_LENGTH_BYTES)
 
-    @classmethod
-    def get_humidity(self, sample):
+    @staticmethod
+    def get_humidity(sample):
         """Get the humidity value from a sample.
 
         Args:
             sample (:class:`blue_st_sdk.feature.Sample`): Sample data.
-        
+
         Returns:
             float: The humidity value if the data array is valid, <nan>
             otherwise.
         """
-        if sample:
-            if sample._data:
-                if sample._data[0]:
-                    return float(sample._data[0])
-        return float('nan')
+        try:
+            return float(sample._data[0])
+        except (AttributeError, IndexError, TypeError):
+            return _NAN
 
     def read_humidity(self):
         """Read the humidity value.
@@ -129,8 +144,5 @@ class FeatureHumidity(Feature):
             :exc:`blue_st_sdk.utils.blue_st_exceptions.BlueSTInvalidDataException`
                 if the data array has not enough data to read.
         """
-        try:
-            self._read_data()
-            return FeatureHumidity.get_humidity(self._get_sample())
-        except (BlueSTInvalidOperationException, BlueSTInvalidDataException) as e:
-            raise e
+        self._read_data()
+        return FeatureHumidity.get_humidity(self._get_sample())
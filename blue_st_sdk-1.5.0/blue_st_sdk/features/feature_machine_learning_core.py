@@ -37,6 +37,12 @@ from blue_st_sdk.utils.number_conversion import NumberConversion
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureMachineLearningCore(Feature):
@@ -135,4 +141,4 @@ class FeatureMachineLearningCore(Feature):
         if sample:
             if sample._data:
                 return sample._data[index]
-        return float('nan')
+        return _NAN
@@ -38,6 +38,12 @@ from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidOperationException
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureMagnetometer(Feature):
@@ -129,7 +135,7 @@ class FeatureMagnetometer(Feature):
             if sample._data:
                 if sample._data[self.X_INDEX]:
                     return float(sample._data[self.X_INDEX])
-        return float('nan')
+        return _NAN
 
     @classmethod
     def get_magnetometer_y(self, sample):
@@ -146,7 +152,7 @@ class FeatureMagnetometer(Feature):
             if sample._data:
                 if sample._data[self.Y_INDEX]:
                     return float(sample._data[self.Y_INDEX])
-        return float('nan')
+        return _NAN
 
     @classmethod
     def get_magnetometer_z(self, sample):
@@ -163,7 +169,7 @@ class FeatureMagnetometer(Feature):
             if sample._data:
                 if sample._data[self.Z_INDEX]:
                     return float(sample._data[self.Z_INDEX])
-        return float('nan')
+        return _NAN
 
     def read_magnetometer(self):
         """Read the magnetometer values.
@@ -38,6 +38,12 @@ from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidOperationException
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeaturePressure(Feature):
@@ -113,7 +119,7 @@ class FeaturePressure(Feature):
             if sample._data:
                 if sample._data[0]:
                     return float(sample._data[0])
-        return float('nan')
+        return _NAN
 
     def read_pressure(self):
         """Read the pressure value.
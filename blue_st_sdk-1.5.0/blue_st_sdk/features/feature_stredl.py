@@ -38,6 +38,12 @@ from blue_st_sdk.utils.number_conversion import NumberConversion
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureSTREDL(Feature):
@@ -136,7 +142,7 @@ class FeatureSTREDL(Feature):
         if sample:
             if sample._data:
                 return sample._data[index]
-        return float('nan')
+        return _NAN
 
     def __str__(self):
         """Get a string representing the last sample.
@@ -39,6 +39,12 @@ from blue_st_sdk.utils.number_conversion import LittleEndian
 from blue_st_sdk.utils.blue_st_exceptions import BlueSTInvalidDataException
 
 
+# CONSTANTS
+
+_NAN = float('nan')
+"""Value returned when a sample has no valid data."""
+
+
 # CLASSES
 
 class FeatureHeartRate(DeviceTimestampFeature):
@@ -122,7 +128,7 @@ class FeatureHeartRate(DeviceTimestampFeature):
                 rri = sample._data[self.RR_INTERVAL_INDEX]
                 if rri:
                     return float(rri)
-        return float('nan')
+        return _NAN
 
     def _extract_data(self, timestamp, data, offset):
         """Extract the data from the feature's raw data.
@@ -167,7 +173,7 @@ class FeatureHeartRate(DeviceTimestampFeature):
             rri = LittleEndian.bytes_to_uint16(data, offset) / 1024.0
             offset += 2
         else:
-            rri = float('nan')
+            rri = _NAN
 
         return ExtractedData(
             Sample(
@@ -28,38 +28,15 @@
 
 # IMPORT
 
-from logging.config import dictConfig
+import logging
 
 
 # CONFIGURATION
 
-# Configuring logging facility. 
-#"format": "%(asctime)s %(levelname)s %(message)s",
-dictConfig(
-    {
-        "version": 1,
-        "formatters": {
-            "standard": {
-                "format": "[%(levelname)-8s] %(message)s"
-            }
-        },
-        "handlers": {
-            "console_handler": {
-                "class": "logging.StreamHandler",
-                "formatter": "standard"
-            }
-        },
-        "root": {
-            "level": "INFO",
-            "handlers": ["console_handler"]
-        },
-        "loggers": {
-            __name__: {
-                "level": "INFO"
-            },
-            "BlueST": {
-                "level": "INFO"
-            }
-        }
-    }
-)
+# Configuring logging facility.
+#format="%(asctime)s %(levelname)s %(message)s",
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(levelname)-8s] %(message)s")
+logging.getLogger('BlueST').setLevel(logging.INFO)
+logging.getLogger(__name__).setLevel(logging.INFO)
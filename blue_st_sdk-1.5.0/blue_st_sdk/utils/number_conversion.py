@@ -38,6 +38,22 @@ numbers.
 import struct
 
 
+# CONSTANTS
+
+# Precompiled converters, so that the hot byte-decoding paths neither
+# re-parse a format string nor slice the input buffer on every call.
+_INT16_LE = struct.Struct('<h')
+_INT32_LE = struct.Struct('<i')
+_UINT16_LE = struct.Struct('<H')
+_UINT32_LE = struct.Struct('<I')
+_FLOAT_LE = struct.Struct('<f')
+_INT16_BE = struct.Struct('>h')
+_INT32_BE = struct.Struct('>i')
+_UINT16_BE = struct.Struct('>H')
+_UINT32_BE = struct.Struct('>I')
+_FLOAT_BE = struct.Struct('>f')
+
+
 # CLASSES
 
 class NumberConversion(object):
@@ -83,7 +99,7 @@ class LittleEndian(object):
         # Python 2
         #return struct.unpack('<h', struct.pack('cc', *data[start : start + 2]))[0]
         # Python 3
-        return struct.unpack('<h', data[start : start + 2])[0]
+        return _INT16_LE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_int32(self, data, start = 0):
@@ -100,7 +116,7 @@ class LittleEndian(object):
         # Python 2
         #return struct.unpack('<i', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('<i', data[start : start + 4])[0]
+        return _INT32_LE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_uint16(self, data, start = 0):
@@ -117,7 +133,7 @@ class LittleEndian(object):
         # Python 2
         #return struct.unpack('<H', struct.pack('cc', *data[start : start + 2]))[0]
         # Python 3
-        return struct.unpack('<H', data[start : start + 2])[0]
+        return _UINT16_LE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_uint32(self, data, start = 0):
@@ -134,7 +150,7 @@ class LittleEndian(object):
         # Python 2
         #return struct.unpack('<I', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('<I', data[start : start + 4])[0]
+        return _UINT32_LE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_float(self, data, start = 0):
@@ -151,7 +167,7 @@ class LittleEndian(object):
         # Python 2
         #return struct.unpack('<f', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('<f', data[start : start + 4])[0]
+        return _FLOAT_LE.unpack_from(data, start)[0]
 
     @classmethod
     def int16_to_bytes(self, value):
@@ -239,7 +255,7 @@ class BigEndian(object):
         # Python 2
         #return struct.unpack('>h', struct.pack('cc', *data[start : start + 2]))[0]
         # Python 3
-        return struct.unpack('>h', data[start : start + 2])[0]
+        return _INT16_BE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_int32(self, data, start = 0):
@@ -256,7 +272,7 @@ class BigEndian(object):
         # Python 2
         #return struct.unpack('>i', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('>i', data[start : start + 4])[0]
+        return _INT32_BE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_uint16(self, data, start = 0):
@@ -273,7 +289,7 @@ class BigEndian(object):
         # Python 2
         #return struct.unpack('>H', struct.pack('cc', *data[start : start + 2]))[0]
         # Python 3
-        return struct.unpack('>H', data[start : start + 2])[0]
+        return _UINT16_BE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_uint32(self, data, start = 0):
@@ -290,7 +306,7 @@ class BigEndian(object):
         # Python 2
         #return struct.unpack('>I', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('>I', data[start : start + 4])[0]
+        return _UINT32_BE.unpack_from(data, start)[0]
 
     @classmethod
     def bytes_to_float(self, data, start = 0):
@@ -307,7 +323,7 @@ class BigEndian(object):
         # Python 2
         #return struct.unpack('>f', struct.pack('cccc', *data[start : start + 4]))[0]
         # Python 3
-        return struct.unpack('>f', data[start : start + 4])[0]
+        return _FLOAT_BE.unpack_from(data, start)[0]
 
     @classmethod
     def int16_to_bytes(self, value):
@@ -1,436 +1,537 @@
-#!/usr/bin/env python
-
-import keyboard
-import logging
-import os
-import sys
-import threading
-import time
-import traceback
-import json
-import config
-
-from blue_st_sdk.manager import Manager
-from blue_st_sdk.manager import ManagerListener
-from blue_st_sdk.device import DeviceListener
-from blue_st_sdk.feature import FeatureListener
-from blue_st_sdk.features.pnpl import feature_pnplike
-from blue_st_sdk.features import feature_neai_anomaly_detection
-
-# Bluetooth scanning time in seconds (optional).
-SCANNING_TIME_s = 5
-
-# Pause in seconds.
-PAUSE_s = 1
-
-# Duration of phases.
-LEARNING_TIME_s = 10
-
-# Timeout for notifications in seconds.
-NOTIFICATIONS_TIMEOUT_s = 0.05
-
-# MAC address of the device to connect to.
-TARGET_DEVICE_MAC = config.mac_address  # Proteus - FP-AI-PDMWBSOC
-
-
-# CLASSES
-
-# Implementation of the interface used by the Manager class to notify that a new
-# device has been discovered or that the scanning starts/stops.
-class MyManagerListener(ManagerListener):
-
-    #
-    # This method is called whenever a discovery process starts or stops.
-    #
-    # @param manager          Manager instance that starts/stops the process.
-    # @param enabled          True if a new discovery starts, False otherwise.
-    #
-    def on_discovery_change(self, manager, enabled):
-        logging.getLogger('BlueST').info(
-            'Discovery of bluetooth devices {}.'.format('started' if enabled else 'stopped'))
-
-    #
-    # This method is called whenever a new device is discovered.
-    #
-    # @param manager          Manager instance that discovers the device.
-    # @param device           New device discovered.
-    # @param error_message    Error message in case the advertisement data
-    #                         does not comply with the BlueST protocol, when:
-    #                         "show_non_bluest_devices=True" in "manager.discover()".
-    #
-    def on_device_discovered(self, manager, device, error_message=False):
-        logging.getLogger('BlueST').info(
-            'NEW DEVICE:   {}{}'.format(
-                device, '' if not error_message else '   ' + error_message))
-
-    #
-    # This method is called whenever an advertising data has updated.
-    #
-    # @param manager          Manager instance that discovers the device.
-    # @param device           Device whose advertising data has updated.
-    # @param advertising_data BlueST advertising data object.
-    #
-    def on_advertising_data_updated(self, manager, device, advertising_data):
-        logging.getLogger('BlueST').info(
-            'UPDATED:      {}'.format(device))
-
-    #
-    # This method is called whenever an advertising data has been received
-    # but has not changed.
-    #
-    # @param manager          Manager instance that discovers the device.
-    # @param device           Device whose advertising data has not changed.
-    # @param advertising_data BlueST advertising data object.
-    #
-    def on_advertising_data_unchanged(self, manager, device, advertising_data):
-        logging.getLogger('BlueST').info(
-            'UNCHANGED:    {}'.format(device))
-
-
-#
-# Implementation of the interface used by the Device class to notify that a device
-# has updated its status.
-#
-class MyDeviceListener(DeviceListener):
-
-    #
-    # To be called whenever a device connects to a host.
-    #
-    # @param device Device that has connected to a host.
-    #
-    def on_connect(self, device):
-        logging.getLogger('BlueST').info(
-            'Device {} connected.'.format(device.get_name()))
-
-    #
-    # To be called whenever a device disconnects from a host.
-    #
-    # @param device     Device that has disconnected from a host.
-    # @param unexpected True if the disconnection is unexpected, False otherwise
-    #                   (called by the user).
-    #
-    def on_disconnect(self, device, unexpected=False):
-        logging.getLogger('BlueST').info(
-            'Device {} disconnected{}.'.format(device.get_name(), ' unexpectedly' if unexpected else ''))
-        if unexpected:
-            # Exiting.
-            logging.getLogger('BlueST').info('')
-            logging.getLogger('BlueST').info('Exiting...')
-            logging.getLogger('BlueST').info('')
-            sys.exit(0)
-
-
-#
-# Implementation of the interface used by the Feature class to notify that a
-# feature has updated its data.
-#
-class MyPnPLikeFeatureListener(FeatureListener):
-
-    #
-    # Constructor.
-    #
-    # @param event Stop event.
-    #
-    def __init__(self, event):
-        self._event = event
-
-    #
-    # To be called whenever the feature updates its data.
-    # Stop event triggered when valid JSON is received.
-    #
-    # @param feature Feature that has updated.
-    # @param sample  Data extracted from the feature.
-    #
-    def on_update(self, feature, sample):
-        logging.getLogger('BlueST').info(feature)
-        self._event.set()
-
-
-#
-# Implementation of the interface used by the Feature class to notify that a
-# feature has updated its data.
-#
-class MyNEAIADFeatureListener(FeatureListener):
-
-    #
-    # Constructor.
-    #
-    # @param event Stop event.
-    #
-    def __init__(self, event):
-        self._event = event
-
-    #
-    # To be called whenever the feature updates its data.
-    #
-    # @param feature Feature that has updated.
-    # @param sample  Data extracted from the feature.
-    #
-    def on_update(self, feature, sample):
-        global command
-        logging.getLogger('BlueST').info(feature)
-        phase = feature.get_phase(sample)
-        if (command == feature_neai_anomaly_detection.Command.LEARN and \
-            phase == feature_neai_anomaly_detection.Phase.IDLE_TRAINED) or \
-           (command == feature_neai_anomaly_detection.Command.DETECT and \
-            (phase == feature_neai_anomaly_detection.Phase.IDLE or \
-             phase == feature_neai_anomaly_detection.Phase.IDLE_TRAINED)) or \
-           (command == feature_neai_anomaly_detection.Command.STOP and \
-            (phase == feature_neai_anomaly_detection.Phase.IDLE or \
-             phase == feature_neai_anomaly_detection.Phase.IDLE_TRAINED)) or \
-           (command == feature_neai_anomaly_detection.Command.RESET and \
-            phase == feature_neai_anomaly_detection.Phase.IDLE):
-            self._event.set()
-
-
-# FUNCTIONS
-
-# Wait for active notifications until the given event is triggered.
-def wait_for_notifications_until_event_triggered(device, stop_event):
-    global command
-    while not stop_event.is_set():
-        device.wait_for_notifications(NOTIFICATIONS_TIMEOUT_s)
-    command = None
-    stop_event.clear()
-
-
-# Wait for active notifications until the given key is pressed.
-def wait_for_notifications_until_key_pressed(device, stop_key):
-    stop_event = threading.Event()
-    KeyboardThread(stop_key, stop_event)
-    wait_for_notifications_until_event_triggered(device, stop_event)
-
-
-# Release manager resources.
-def release_manager_resources(manager):
-    if manager:
-        manager.remove_listeners()
-
-
-# Release device resources.
-def release_device_resources(device):
-    if device:
-        for feature in device.get_features():
-            if feature:
-                feature.remove_listeners()
-        if device.is_connected():
-            device.remove_listeners()
-            device.disconnect()
-
-
-# Main application.
-def main(argv):
-    global command
-    upstream_dict = {"message":""}
-    with open("/home/weston/proteus-neai-demo-main/communication-jsons/upstream_message.json", "w") as upstream_file:
-        json.dump(upstream_dict, upstream_file)
-
-    # Setting text logging level: 'DEBUG', 'INFO' (default), 'WARNING', 'ERROR', or 'CRITICAL'.
-    logging.getLogger('BlueST').setLevel('DEBUG')
-
-    # Printing intro.
-    logging.getLogger('BlueST').info('BlueST example: "{}"'.format(os.path.basename(__file__)))
-
-    try:
-        # Creating bluetooth manager.
-        manager = Manager.instance()
-        manager_listener = MyManagerListener()
-        manager.add_listener(manager_listener)
-
-        # Scanning bluetooth devices.
-        logging.getLogger('BlueST').info('')
-        logging.getLogger('BlueST').info('Scanning bluetooth devices... (CTRL+C to quit)')
-        logging.getLogger('BlueST').info('')
-
-        # Synchronous discovery of bluetooth devices.
-        # manager.discover(SCANNING_TIME_s, show_non_bluest_devices=False)
-
-        # Asynchronous discovery of bluetooth devices.
-        # Alternative 1.
-        #manager.discover(SCANNING_TIME_s, asynchronous=True)
-        #time.sleep(SCANNING_TIME_s)
-
-        # Asynchronous discovery of bluetooth devices.
-        # Alternative 2.
-        manager.start_discovery()
-        time.sleep(SCANNING_TIME_s)
-        manager.stop_discovery()
-
-        # Getting discovered devices.
-        discovered_devices = manager.get_devices()
-
-        # Listing discovered devices.
-        if not discovered_devices:
-            logging.getLogger('BlueST').info('No bluetooth devices found. Exiting...')
-            logging.getLogger('BlueST').info('')
-            sys.exit(0)
-        logging.getLogger('BlueST').info('')
-        logging.getLogger('BlueST').info('Available bluetooth devices:')
-        for i, device in enumerate(discovered_devices):
-            logging.getLogger('BlueST').info('%d) %s: [%s]' % (i, device.get_name(), device.get_mac_address()))
-            i += 1
-        logging.getLogger('BlueST').info('')
-
-        # Connecting to the target device.
-        device_found = False
-        for i, device in enumerate(discovered_devices):
-            if device.get_mac_address() == TARGET_DEVICE_MAC:
-                device_found = True
-                break
-        if not device_found:
-            raise Exception("Error: target MAC address not found.")
-        device_listener = MyDeviceListener()
-        device.add_listener(device_listener)
-        logging.getLogger('BlueST').info('Connecting to %s...' % (device.get_name()))
-        if not device.connect():
-            logging.getLogger('BlueST').info('Connection failed.')
-            logging.getLogger('BlueST').info('')
-            raise Exception()
-
-        # Getting features.
-        features = device.get_features()
-        logging.getLogger('BlueST').info('')
-        logging.getLogger('BlueST').info('Features:')
-        for i, feature in enumerate(features):
-            if feature:
-                logging.getLogger('BlueST').info('%d) %s' % (i, feature.get_name()))
-            i += 1
-        logging.getLogger('BlueST').info('')
-
-        # Add PnPLike feature and listener, and enable notifications.
-        feature_pnpl = device.get_feature(feature_pnplike.FeaturePnPLike)
-        pnpl_response_event = threading.Event()
-        feature_pnpl_listener = MyPnPLikeFeatureListener(pnpl_response_event)
-        feature_pnpl.add_listener(feature_pnpl_listener)
-
-        # Add NEAIAnomalyDetection feature and listener, and enable notifications.
-        feature_neai_ad = device.get_feature(feature_neai_anomaly_detection.FeatureNEAIAnomalyDetection)
-        neai_ad_response_event = threading.Event()
-        feature_neai_ad_listener = MyNEAIADFeatureListener(neai_ad_response_event)
-        feature_neai_ad.add_listener(feature_neai_ad_listener)
-
-        # Configuring learning time.
-        pnpl_command = "{\"neai_anomaly_detection\": {\"time_or_signals\": " + str(LEARNING_TIME_s) + "}}"
-        logging.getLogger('BlueST').info("Sending '{}' command.".format(pnpl_command))
-        feature_pnpl.send_command(pnpl_command)
-        device.enable_notifications(feature_pnpl)
-        wait_for_notifications_until_event_triggered(device, pnpl_response_event)
-        device.disable_notifications(feature_pnpl)
-        logging.getLogger('BlueST').info('')
-        upstream_dict["message"] = "1st COMMS SUCCESSFUL"
-        with open("/home/weston/proteus-neai-demo-main/communication-jsons/upstream_message.json", "w") as upstream_file:
-            json.dump(upstream_dict, upstream_file)
-
-        current_state = "IDLE"
-        last_command = ""
-        
-        # COMMUNICATION LOOP.
-        while True:
-            # Open commands communication file
-            with open("/home/weston/proteus-neai-demo-main/communication-jsons/downstream_commands.json", "r") as downstream_file:
-                try:
-                    # Copy command json into a dictionary
-                    dict = json.load(downstream_file)
-                except Exception as e:
-                    print("Trouble reading downsteam command file, trying again soon...")
-                    print(e)
-                    # If unable to copy command json, return to beginning of loop after a brief pause
-                    time.sleep(1)
-                    continue
-            # If the received command is the same as the last received command
-            if dict["command"] == last_command:
-                # Ignore it and return to the beginning of the loop after a brief pause
-                time.sleep(1)
-                continue
-            else:
-                # Keep track of this command as the most recent command
-                last_command = dict["command"]
-                
-            # START ANOMALY DETECTION
-            if dict["command"] == 'start_ad':
-                command = feature_neai_anomaly_detection.Command.DETECT
-                logging.getLogger('BlueST').info('Anomaly detection started... Press "ESC" to stop.')
-                feature_neai_ad.detect()
-                device.enable_notifications(feature_neai_ad)
-                current_state = "ANOMALY DETECTION"
-                upstream_dict["message"] = ""
-                while True:
-                    time.sleep(0.5)
-                    with open("/home/weston/proteus-neai-demo-main/communication-jsons/downstream_commands.json", "r") as downstream_file:
-                        try:
-                            dict = json.load(downstream_file)
-                        except:
-                            print("Trouble reading downstream command file. trying again soon...")
-                            continue
-                    if dict["command"] == 'stop_ad':
-                        break
-                    else:
-                        device.wait_for_notifications(NOTIFICATIONS_TIMEOUT_s)
-                        if dict["command"] in ["learn","reset_knowledge"] and dict["command"] != last_command:
-                            msg_str = "DEVICE IN ANOMALY DETECTION MODE... COMMAND " + dict["command"] + " IGNORED."
-                            last_command = dict["command"]
-                            upstream_dict["message"] = msg_str
-                            with open("/home/weston/proteus-neai-demo-main/communication-jsons/upstream_message.json", "w") as upstream_file:
-                                json.dump(upstream_dict, upstream_file)
-            # STOP ANOMALY DETECTION
-            elif dict["command"] == 'stop_ad':
-                if current_state != "ANOMALY DETECTION":
-                    upstream_dict["message"] = "DEVICE NOT IN ANOMALY DETECTION MODE SO COMMAND stop_ad IGNORED."
-                    with open("/home/weston/proteus-neai-demo-main/communication-jsons/upstream_message.json", "w") as upstream_file:
-                        json.dump(upstream_dict, upstream_file) 
-                    continue
-                command = feature_neai_anomaly_detection.Command.STOP
-                feature_neai_ad.stop()
-                wait_for_notifications_until_event_triggered(device, neai_ad_response_event)
-                device.disable_notifications(feature_neai_ad)
-                logging.getLogger('BlueST').info('Anomaly detection stopped.')
-                logging.getLogger('BlueST').info('')
-                current_state = "IDLE"
-            # RESET KNOWLEDGE
-            elif dict["command"] == 'reset_knowledge':
-                # Resetting model.
-                command = feature_neai_anomaly_detection.Command.RESET
-                logging.getLogger('BlueST').info('Resetting model...')
-                device.enable_notifications(feature_neai_ad)
-                feature_neai_ad.reset()
-                wait_for_notifications_until_event_triggered(device, neai_ad_response_event)
-                device.disable_notifications(feature_neai_ad)
-                logging.getLogger('BlueST').info('Model cleared.')
-                logging.getLogger('BlueST').info('')
-            # LEARNING
-            elif dict["command"] == 'learn':
-                command = feature_neai_anomaly_detection.Command.LEARN
-                logging.getLogger('BlueST').info('Learning started ({} seconds)...'.format(LEARNING_TIME_s))
-                feature_neai_ad.learn()
-                device.enable_notifications(feature_neai_ad)
-                wait_for_notifications_until_event_triggered(device, neai_ad_response_event)
-                device.disable_notifications(feature_neai_ad)
-                logging.getLogger('BlueST').info('Learning stopped.')
-                logging.getLogger('BlueST').info('')
-
-
-    except Exception as e:
-        try:
-            # Traceback.
-            logging.getLogger('BlueST').info(repr(e))
-            traceback.print_exc(file=sys.stdout)
-            # Exiting.
-            if 'manager' in locals():
-                release_manager_resources(manager)
-            if 'device' in locals():
-                release_device_resources(device)
-            logging.getLogger('BlueST').info('')
-            logging.getLogger('BlueST').info('Exiting...')
-            logging.getLogger('BlueST').info('')
-            sys.exit(0)
-        except SystemExit:
-            os._exit(0)
-
-
-if __name__ == '__main__':
-
-    # Global variables.
-    command = None
-
-    # Running main function.
-    main(sys.argv[1:])
+#!/usr/bin/env python
+
+import logging
+import os
+from contextlib import ExitStack
+from dataclasses import dataclass
+import subprocess
+import sys
+import time
+import traceback
+import json
+import config
+
+from inotify_simple import INotify, flags
+
+# Optional C-extension JSON codec for the tiny command-exchange files; the
+# stdlib json module is used when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from blue_st_sdk.manager import Manager
+from blue_st_sdk.manager import ManagerListener
+from blue_st_sdk.device import DeviceListener
+from blue_st_sdk.feature import FeatureListener
+from blue_st_sdk.features.pnpl import feature_pnplike
+from blue_st_sdk.features import feature_neai_anomaly_detection
+
+# Bluetooth scanning time in seconds (optional).
+SCANNING_TIME_s = 5
+
+# Pause in seconds.
+PAUSE_s = 1
+
+# Duration of phases.
+LEARNING_TIME_s = 10
+
+# Timeout for notifications in seconds. Kept large so that the BLE stack can
+# deliver several queued notifications per wakeup instead of one per 50 ms
+# round-trip.
+NOTIFICATIONS_TIMEOUT_s = 0.5
+
+# Timeout for the drain calls that follow a received notification. Must be
+# positive: bluepy treats a zero timeout as "wait forever".
+DRAIN_TIMEOUT_s = 0.01
+
+# MAC address of the device to connect to.
+TARGET_DEVICE_MAC = config.mac_address  # Proteus - FP-AI-PDMWBSOC
+
+# Paths of the JSON files exchanged with the IoTConnect-side script.
+COMMS_JSON_DIR = "/home/weston/proteus-neai-demo-main/communication-jsons/"
+DOWNSTREAM_COMMANDS_PATH = COMMS_JSON_DIR + "downstream_commands.json"
+UPSTREAM_MESSAGE_PATH = COMMS_JSON_DIR + "upstream_message.json"
+
+# PnPL command configuring the learning time, precomputed from the constant
+# above via json.dumps instead of hand-escaped string concatenation.
+_PNPL_LEARN_CMD = json.dumps(
+    {"neai_anomaly_detection": {"time_or_signals": LEARNING_TIME_s}})
+
+# Logger, looked up once instead of on every BLE event.
+_LOG = logging.getLogger('BlueST')
+
+# Phases that complete each command, precomputed so that the notification
+# callback does one dict/set lookup instead of re-evaluating a chain of
+# attribute fetches and comparisons per BLE notification.
+_TERMINAL_PHASES = {
+    feature_neai_anomaly_detection.Command.LEARN:
+        frozenset((feature_neai_anomaly_detection.Phase.IDLE_TRAINED,)),
+    feature_neai_anomaly_detection.Command.DETECT:
+        frozenset((feature_neai_anomaly_detection.Phase.IDLE,
+                   feature_neai_anomaly_detection.Phase.IDLE_TRAINED)),
+    feature_neai_anomaly_detection.Command.STOP:
+        frozenset((feature_neai_anomaly_detection.Phase.IDLE,
+                   feature_neai_anomaly_detection.Phase.IDLE_TRAINED)),
+    feature_neai_anomaly_detection.Command.RESET:
+        frozenset((feature_neai_anomaly_detection.Phase.IDLE,)),
+}
+_NO_PHASES = frozenset()
+
+
+# CLASSES
+
+# State shared between main() and the BLE notification callbacks, passed
+# explicitly instead of going through a module global: attribute access on a
+# known instance is cheaper than a LOAD_GLOBAL per notification and keeps the
+# cross-thread write in one obvious place.
+@dataclass
+class State:
+    command: feature_neai_anomaly_detection.Command = None
+
+
+# Implementation of the interface used by the Manager class to notify that a new
+# device has been discovered or that the scanning starts/stops.
+class MyManagerListener(ManagerListener):
+
+    #
+    # This method is called whenever a discovery process starts or stops.
+    #
+    # @param manager          Manager instance that starts/stops the process.
+    # @param enabled          True if a new discovery starts, False otherwise.
+    #
+    def on_discovery_change(self, manager, enabled):
+        _LOG.info(
+            'Discovery of bluetooth devices %s.', 'started' if enabled else 'stopped')
+
+    #
+    # This method is called whenever a new device is discovered.
+    #
+    # @param manager          Manager instance that discovers the device.
+    # @param device           New device discovered.
+    # @param error_message    Error message in case the advertisement data
+    #                         does not comply with the BlueST protocol, when:
+    #                         "show_non_bluest_devices=True" in "manager.discover()".
+    #
+    def on_device_discovered(self, manager, device, error_message=False):
+        _LOG.info(
+            'NEW DEVICE:   %s%s',
+            device, '' if not error_message else '   ' + error_message)
+
+    #
+    # This method is called whenever an advertising data has updated.
+    #
+    # @param manager          Manager instance that discovers the device.
+    # @param device           Device whose advertising data has updated.
+    # @param advertising_data BlueST advertising data object.
+    #
+    def on_advertising_data_updated(self, manager, device, advertising_data):
+        _LOG.info('UPDATED:      %s', device)
+
+    #
+    # This method is called whenever an advertising data has been received
+    # but has not changed.
+    #
+    # @param manager          Manager instance that discovers the device.
+    # @param device           Device whose advertising data has not changed.
+    # @param advertising_data BlueST advertising data object.
+    #
+    def on_advertising_data_unchanged(self, manager, device, advertising_data):
+        _LOG.info('UNCHANGED:    %s', device)
+
+
+#
+# Implementation of the interface used by the Device class to notify that a device
+# has updated its status.
+#
+class MyDeviceListener(DeviceListener):
+
+    #
+    # To be called whenever a device connects to a host.
+    #
+    # @param device Device that has connected to a host.
+    #
+    def on_connect(self, device):
+        _LOG.info('Device %s connected.', device.get_name())
+
+    #
+    # To be called whenever a device disconnects from a host.
+    #
+    # @param device     Device that has disconnected from a host.
+    # @param unexpected True if the disconnection is unexpected, False otherwise
+    #                   (called by the user).
+    #
+    def on_disconnect(self, device, unexpected=False):
+        _LOG.info(
+            'Device %s disconnected%s.',
+            device.get_name(), ' unexpectedly' if unexpected else '')
+        if unexpected:
+            # Exiting.
+            _LOG.info('')
+            _LOG.info('Exiting...')
+            _LOG.info('')
+            sys.exit(0)
+
+
+#
+# Implementation of the interface used by the Feature class to notify that a
+# feature has updated its data.
+#
+class MyPnPLikeFeatureListener(FeatureListener):
+
+    #
+    # Constructor.
+    #
+    # @param stop_flag One-element list used as stop flag.
+    #
+    def __init__(self, stop_flag):
+        self._stop_flag = stop_flag
+
+    #
+    # To be called whenever the feature updates its data.
+    # Stop flag raised when valid JSON is received.
+    #
+    # @param feature Feature that has updated.
+    # @param sample  Data extracted from the feature.
+    #
+    def on_update(self, feature, sample):
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info('%s', feature)
+        self._stop_flag[0] = True
+
+
+#
+# Implementation of the interface used by the Feature class to notify that a
+# feature has updated its data.
+#
+class MyNEAIADFeatureListener(FeatureListener):
+
+    #
+    # Constructor.
+    #
+    # @param stop_flag One-element list used as stop flag.
+    # @param state     Shared state carrying the command in progress.
+    #
+    def __init__(self, stop_flag, state):
+        self._stop_flag = stop_flag
+        self._state = state
+
+    #
+    # To be called whenever the feature updates its data.
+    #
+    # @param feature Feature that has updated.
+    # @param sample  Data extracted from the feature.
+    #
+    def on_update(self, feature, sample):
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info('%s', feature)
+        phase = feature.get_phase(sample)
+        if phase in _TERMINAL_PHASES.get(self._state.command, _NO_PHASES):
+            self._stop_flag[0] = True
+
+
+# FUNCTIONS
+
+# Wait for active notifications until the given stop flag is raised.
+# The flag is a one-element list written by the BLE notification thread and
+# read here: a plain list index is enough as a cross-thread flag and avoids
+# the lock and condition variable behind threading.Event on every check.
+def wait_for_notifications_until_event_triggered(device, stop_flag, state):
+    while not stop_flag[0]:
+        device.wait_for_notifications(NOTIFICATIONS_TIMEOUT_s)
+        # Drain any further notifications queued in the same burst before
+        # re-checking the flag.
+        while not stop_flag[0] \
+                and device.wait_for_notifications(DRAIN_TIMEOUT_s):
+            pass
+    state.command = None
+    stop_flag[0] = False
+
+
+# Wait until the downstream commands file has been written, or the given
+# timeout in milliseconds has elapsed. Returns True on a write, False on
+# timeout.
+def wait_for_downstream_change(inotify, timeout_ms):
+    changed = False
+    for event in inotify.read(timeout=timeout_ms):
+        if event.name == 'downstream_commands.json':
+            changed = True
+    return changed
+
+
+# Last message published to the upstream JSON, used to skip rewrites of
+# unchanged content.
+_last_upstream_message = [None]
+
+
+# Publish a message to the upstream JSON atomically, and only when it differs
+# from the last published one. Writing a temporary file and os.replace()-ing
+# it into place keeps the reader from ever seeing a half-written file.
+def publish_upstream_message(message):
+    if message == _last_upstream_message[0]:
+        return
+    _last_upstream_message[0] = message
+    with open(UPSTREAM_MESSAGE_PATH + ".tmp", "wb") as upstream_file:
+        if orjson:
+            upstream_file.write(orjson.dumps({"message": message}))
+        else:
+            upstream_file.write(json.dumps({"message": message}).encode())
+    os.replace(UPSTREAM_MESSAGE_PATH + ".tmp", UPSTREAM_MESSAGE_PATH)
+
+
+# Release manager resources.
+def release_manager_resources(manager):
+    if manager:
+        manager.remove_listeners()
+
+
+# Release device resources.
+def release_device_resources(device):
+    if device:
+        for feature in device.get_features():
+            if feature:
+                feature.remove_listeners()
+        if device.is_connected():
+            device.remove_listeners()
+            device.disconnect()
+
+
+# Main application.
+def main(argv):
+    state = State()
+    publish_upstream_message("")
+
+    # Setting text logging level: 'DEBUG', 'INFO' (default), 'WARNING', 'ERROR', or 'CRITICAL'.
+    _LOG.setLevel('DEBUG')
+
+    # Printing intro.
+    _LOG.info('BlueST example: "%s"', os.path.basename(__file__))
+
+    try:
+        # Resources are registered with the stack as they are created and
+        # released automatically, newest first, on any exit path —
+        # including the sys.exit() raised on unexpected disconnection.
+        with ExitStack() as cleanup:
+            # Creating bluetooth manager.
+            manager = Manager.instance()
+            manager_listener = MyManagerListener()
+            manager.add_listener(manager_listener)
+            cleanup.callback(release_manager_resources, manager)
+
+            # Scanning bluetooth devices.
+            _LOG.info('')
+            _LOG.info('Scanning bluetooth devices... (CTRL+C to quit)')
+            _LOG.info('')
+
+            # Synchronous discovery of bluetooth devices.
+            # manager.discover(SCANNING_TIME_s, show_non_bluest_devices=False)
+
+            # Asynchronous discovery of bluetooth devices.
+            # Alternative 1.
+            #manager.discover(SCANNING_TIME_s, asynchronous=True)
+            #time.sleep(SCANNING_TIME_s)
+
+            # Asynchronous discovery of bluetooth devices.
+            # Alternative 2.
+            manager.start_discovery()
+            time.sleep(SCANNING_TIME_s)
+            manager.stop_discovery()
+
+            # Getting discovered devices.
+            discovered_devices = manager.get_devices()
+
+            # Listing discovered devices.
+            if not discovered_devices:
+                _LOG.info('No bluetooth devices found. Exiting...')
+                _LOG.info('')
+                sys.exit(0)
+            _LOG.info('')
+            # One joined message per list: a single formatting pass and a single
+            # acquisition of the logging lock instead of one per entry.
+            _LOG.info('Available bluetooth devices:\n%s', '\n'.join(
+                '%d) %s: [%s]' % (i, device.get_name(), device.get_mac_address())
+                for i, device in enumerate(discovered_devices)))
+            _LOG.info('')
+
+            # Connecting to the target device.
+            device = {d.get_mac_address(): d
+                      for d in discovered_devices}.get(TARGET_DEVICE_MAC)
+            if device is None:
+                raise Exception("Error: target MAC address not found.")
+            device_listener = MyDeviceListener()
+            device.add_listener(device_listener)
+            cleanup.callback(release_device_resources, device)
+            # Best effort: ask the controller to prefer the LE 2M PHY for the
+            # upcoming connection, which doubles the raw symbol rate. bluepy has
+            # no per-connection PHY API, so this goes through btmgmt and is
+            # simply skipped where the tool or the controller does not support
+            # it. MTU exchange is left alone: the SDK deliberately skips it for
+            # Proteus devices.
+            try:
+                subprocess.run(
+                    ['btmgmt', 'phy', 'LE1MTX', 'LE1MRX', 'LE2MTX', 'LE2MRX'],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=5, check=False)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            _LOG.info('Connecting to %s...', device.get_name())
+            if not device.connect():
+                _LOG.info('Connection failed.')
+                _LOG.info('')
+                raise Exception()
+
+            # Getting features.
+            features = device.get_features()
+            _LOG.info('')
+            _LOG.info('Features:\n%s', '\n'.join(
+                '%d) %s' % (i, feature.get_name())
+                for i, feature in enumerate(features) if feature))
+            _LOG.info('')
+
+            # Add PnPLike feature and listener, and enable notifications.
+            feature_pnpl = device.get_feature(feature_pnplike.FeaturePnPLike)
+            pnpl_response_flag = [False]
+            feature_pnpl_listener = MyPnPLikeFeatureListener(pnpl_response_flag)
+            feature_pnpl.add_listener(feature_pnpl_listener)
+
+            # Add NEAIAnomalyDetection feature and listener, and enable notifications.
+            feature_neai_ad = device.get_feature(feature_neai_anomaly_detection.FeatureNEAIAnomalyDetection)
+            neai_ad_response_flag = [False]
+            feature_neai_ad_listener = MyNEAIADFeatureListener(neai_ad_response_flag, state)
+            feature_neai_ad.add_listener(feature_neai_ad_listener)
+            # Enable notifications once for the process lifetime: every CCCD
+            # write costs a full connection-interval round-trip, and the listener
+            # already gates on the command in progress, so notifications between
+            # commands are cheap to ignore.
+            device.enable_notifications(feature_neai_ad)
+
+            # Configuring learning time.
+            _LOG.info("Sending '%s' command.", _PNPL_LEARN_CMD)
+            feature_pnpl.send_command(_PNPL_LEARN_CMD)
+            device.enable_notifications(feature_pnpl)
+            wait_for_notifications_until_event_triggered(device, pnpl_response_flag, state)
+            device.disable_notifications(feature_pnpl)
+            _LOG.info('')
+            publish_upstream_message("1st COMMS SUCCESSFUL")
+
+            current_state = "IDLE"
+            last_command = ""
+
+            # Watching the commands communication file, so that the loop below
+            # blocks until it is written instead of polling it.
+            inotify = INotify()
+            inotify.add_watch(COMMS_JSON_DIR, flags.CLOSE_WRITE | flags.MOVED_TO)
+            last_downstream_mtime = None
+
+            # COMMUNICATION LOOP.
+            while True:
+                # Skip the open+parse entirely when the file has not changed
+                # since the previous iteration: one stat syscall instead of a
+                # JSON parse on spurious wakeups.
+                downstream_mtime = os.stat(DOWNSTREAM_COMMANDS_PATH).st_mtime_ns
+                if downstream_mtime == last_downstream_mtime:
+                    wait_for_downstream_change(inotify, 1000)
+                    continue
+                last_downstream_mtime = downstream_mtime
+                # Open commands communication file
+                with open(DOWNSTREAM_COMMANDS_PATH, "rb") as downstream_file:
+                    try:
+                        # Copy command json into a dictionary
+                        cmd = orjson.loads(downstream_file.read()) if orjson \
+                            else json.load(downstream_file)
+                    except Exception as e:
+                        print("Trouble reading downsteam command file, trying again soon...")
+                        print(e)
+                        # If unable to copy command json, block until it is written again
+                        wait_for_downstream_change(inotify, 1000)
+                        continue
+                # If the received command is the same as the last received command
+                if cmd["command"] == last_command:
+                    # Ignore it and block until the file is written again
+                    wait_for_downstream_change(inotify, 1000)
+                    continue
+                else:
+                    # Keep track of this command as the most recent command
+                    last_command = cmd["command"]
+                
+                # START ANOMALY DETECTION
+                if cmd["command"] == 'start_ad':
+                    state.command = feature_neai_anomaly_detection.Command.DETECT
+                    _LOG.info('Anomaly detection started...')
+                    feature_neai_ad.detect()
+                    current_state = "ANOMALY DETECTION"
+                    while True:
+                        # Drain BLE notifications; only re-read the commands file
+                        # when it has actually been written.
+                        device.wait_for_notifications(NOTIFICATIONS_TIMEOUT_s)
+                        if not wait_for_downstream_change(inotify, 500):
+                            continue
+                        downstream_mtime = os.stat(DOWNSTREAM_COMMANDS_PATH).st_mtime_ns
+                        if downstream_mtime == last_downstream_mtime:
+                            continue
+                        last_downstream_mtime = downstream_mtime
+                        with open(DOWNSTREAM_COMMANDS_PATH, "rb") as downstream_file:
+                            try:
+                                cmd = orjson.loads(downstream_file.read()) if orjson \
+                                    else json.load(downstream_file)
+                            except:
+                                print("Trouble reading downstream command file. trying again soon...")
+                                continue
+                        if cmd["command"] == 'stop_ad':
+                            # Clear the mtime gate so that the outer loop
+                            # re-parses the file and dispatches stop_ad.
+                            last_downstream_mtime = None
+                            break
+                        else:
+                            if cmd["command"] in ["learn","reset_knowledge"] and cmd["command"] != last_command:
+                                msg_str = "DEVICE IN ANOMALY DETECTION MODE... COMMAND " + cmd["command"] + " IGNORED."
+                                last_command = cmd["command"]
+                                publish_upstream_message(msg_str)
+                # STOP ANOMALY DETECTION
+                elif cmd["command"] == 'stop_ad':
+                    if current_state != "ANOMALY DETECTION":
+                        publish_upstream_message("DEVICE NOT IN ANOMALY DETECTION MODE SO COMMAND stop_ad IGNORED.")
+                        continue
+                    state.command = feature_neai_anomaly_detection.Command.STOP
+                    feature_neai_ad.stop()
+                    wait_for_notifications_until_event_triggered(device, neai_ad_response_flag, state)
+                    _LOG.info('Anomaly detection stopped.')
+                    _LOG.info('')
+                    current_state = "IDLE"
+                # RESET KNOWLEDGE
+                elif cmd["command"] == 'reset_knowledge':
+                    # Resetting model.
+                    state.command = feature_neai_anomaly_detection.Command.RESET
+                    _LOG.info('Resetting model...')
+                    feature_neai_ad.reset()
+                    wait_for_notifications_until_event_triggered(device, neai_ad_response_flag, state)
+                    _LOG.info('Model cleared.')
+                    _LOG.info('')
+                # LEARNING
+                elif cmd["command"] == 'learn':
+                    state.command = feature_neai_anomaly_detection.Command.LEARN
+                    _LOG.info('Learning started (%s seconds)...', LEARNING_TIME_s)
+                    feature_neai_ad.learn()
+                    wait_for_notifications_until_event_triggered(device, neai_ad_response_flag, state)
+                    _LOG.info('Learning stopped.')
+                    _LOG.info('')
+
+
+    except Exception as e:
+        try:
+            # Traceback.
+            _LOG.info(repr(e))
+            traceback.print_exc(file=sys.stdout)
+            # Exiting.
+            _LOG.info('')
+            _LOG.info('Exiting...')
+            _LOG.info('')
+            sys.exit(0)
+        except SystemExit:
+            os._exit(0)
+
+
+if __name__ == '__main__':
+
+    # Running main function.
+    main(sys.argv[1:])
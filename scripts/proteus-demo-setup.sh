@@ -4,6 +4,7 @@ apt-get update
 apt-get upgrade -y
 apt-get install python3-pip -y
 pip3 install paho-mqtt==1.6.1
+pip3 install inotify_simple
 apt-get install opus-tools -y
 cp -r /media/usbdrive/proteus-neai-demo-main /home/weston
 cd /home/weston/proteus-neai-demo-main/iotc-python-sdk-master-std-21-patch/iotconnect-sdk-1.0